@@ -1,31 +1,80 @@
 import re               # For regular expressions in email and password validation
 import random           # For generating random subject IDs and marks
 import pickle           # For file storage of student data
+import pickletools      # For trimming pickled snapshots before writing
 import os               # To check file existence
-import tkinter as tk    # For GUI interface
-from tkinter import messagebox  # For GUI message boxes
+import bisect           # For mapping marks to grades
+import queue            # For handing disk writes to the background writer
+import threading        # For the background writer thread
+
+# tkinter is imported by GUIUniApp on first use so CLI mode never loads Tk
+tk = None               # For GUI interface
+messagebox = None       # For GUI message boxes
+
+# Validation patterns compiled once at import time, ASCII-only like the formats they check
+_EMAIL_RE = re.compile(r"^[a-zA-Z]+\.[a-zA-Z]+@university\.com$", re.ASCII)
+_PASSWORD_RE = re.compile(r"^[A-Z][a-zA-Z]{4,}\d{3,}$", re.ASCII)
+
+# Lower mark bounds of each grade band and the grade below/within each band
+_GRADE_THRESHOLDS = (50, 65, 75, 85)
+_GRADE_LABELS = ("Z", "P", "C", "D", "HD")
+
+# Heading printed above the admin student list
+_STUDENT_LIST_HEADER = "\033[93mStudent List\033[0m"
+
+# Exclusive upper bounds of the student and subject ID ranges
+_STUDENT_ID_MAX = 1_000_000
+_SUBJECT_ID_MAX = 1_000
+
+
+def _random_student_id():
+    """Returns a random 6-digit student ID with leading zeros."""
+    return "%06d" % random.randrange(1, _STUDENT_ID_MAX)
+
+
+def _random_subject_id():
+    """Returns a random 3-digit subject ID with leading zeros."""
+    return "%03d" % random.randrange(1, _SUBJECT_ID_MAX)
+
+
+def _report_save_error(error):
+    """Tells the user that a change could not be written to students.data."""
+    print(f"\033[91mCould not save student data: {error}\033[0m")
 
 
 class Student:
+    __slots__ = ('id', 'name', 'email', 'password', 'subjects', '_avg_cache')
+
     def __init__(self, name, email, password):
-        self.id = f"{random.randint(1, 999999):06}"  # Unique 6-digit ID
+        self.id = _random_student_id()  # Unique 6-digit ID
         self.name = name
         self.email = email
         self.password = password
-        self.subjects = []  # List to store subjects
+        self.subjects = {}  # Subjects keyed by subject ID
+        self._avg_cache = None  # Average mark, reset whenever subjects change
+
+    def __getstate__(self):
+        """Pickles the student as a plain tuple; the cached average is not stored."""
+        return self.id, self.name, self.email, self.password, self.subjects
+
+    def __setstate__(self, state):
+        """Restores a pickled student, including ones saved with a __dict__ by older versions."""
+        if isinstance(state, dict):
+            state = (state['id'], state['name'], state['email'], state['password'], state['subjects'])
+        self.id, self.name, self.email, self.password, self.subjects = state
+        self._avg_cache = None
 
     def enroll_subject(self):
         """Enrolls the student in a new subject with a unique ID if they haven't exceeded 4 subjects."""
         if len(self.subjects) >= 4:
             return None
 
-        # Create a new Subject instance
-        new_subject = Subject()
-
-        # Check if the subject ID is unique within the student's subjects
-        existing_subject_ids = {subj['id'] for subj in self.subjects}
-        while new_subject.id in existing_subject_ids:
-            new_subject = Subject()  # Generate a new Subject if there's a duplicate ID
+        # Draw from the IDs still free for this student, skipping past the taken ones
+        number = random.randrange(1, _SUBJECT_ID_MAX - len(self.subjects))
+        for taken in sorted(int(subject_id) for subject_id in self.subjects):
+            if taken <= number:
+                number += 1
+        new_subject = Subject("%03d" % number)
 
         # Add the unique subject to the student's list
         subject_info = {
@@ -33,73 +82,313 @@ class Student:
             'mark': new_subject.mark,
             'grade': new_subject.grade
         }
-        self.subjects.append(subject_info)
+        self.subjects[new_subject.id] = subject_info
+        self._avg_cache = None
         return subject_info
 
     def drop_subject(self, subject_id):
-        """Removes a subject from the student's list of subjects by subject ID."""
-        self.subjects = [subject for subject in self.subjects if subject['id'] != subject_id]
+        """Removes a subject from the student's subjects by subject ID."""
+        self.subjects.pop(subject_id, None)
+        self._avg_cache = None
 
     def calculate_average_mark(self):
         """Calculates the average mark of all enrolled subjects."""
+        if self._avg_cache is not None:
+            return self._avg_cache
         if not self.subjects:
             return 0
-        total_marks = sum(subject['mark'] for subject in self.subjects)
-        return total_marks / len(self.subjects)
+        total_marks = sum(subject['mark'] for subject in self.subjects.values())
+        self._avg_cache = total_marks / len(self.subjects)
+        return self._avg_cache
 
     def is_passing(self):
         """Checks if the student is passing based on an average mark of 50 or more."""
-        return self.calculate_average_mark() >= 50
+        if self._avg_cache is not None:
+            return self._avg_cache >= 50
+        if not self.subjects:
+            return False
+        # Compare the total against 50 per subject to avoid dividing
+        total_marks = sum(subject['mark'] for subject in self.subjects.values())
+        return total_marks >= 50 * len(self.subjects)
 
     def change_password(self, new_password):
         """Changes the student's password."""
         self.password = new_password
 
 class Subject:
-    def __init__(self):
-        self.id = f"{random.randint(1, 999):03}"  # Unique 3-digit ID
+    __slots__ = ('id', 'mark', 'grade')
+
+    def __init__(self, subject_id=None):
+        self.id = subject_id or _random_subject_id()  # Unique 3-digit ID
         self.mark = random.randint(25, 100)       # Random mark between 25 and 100
         self.grade = self.assign_grade(self.mark) # Assign grade based on the mark
 
-    def assign_grade(self, mark):
+    @staticmethod
+    def assign_grade(mark):
         """Assigns a grade based on the UTS grading system."""
-        if mark < 50:
-            return "Z"
-        elif 50 <= mark < 65:
-            return "P"
-        elif 65 <= mark < 75:
-            return "C"
-        elif 75 <= mark < 85:
-            return "D"
-        else:  # mark >= 85
-            return "HD"
+        return _GRADE_LABELS[bisect.bisect_right(_GRADE_THRESHOLDS, mark)]
+
+
+class _PendingWrite:
+    """A pickled journal record or snapshot waiting for the Database writer thread."""
+    __slots__ = ('kind', 'raw', 'email', 'notify', 'error', 'done')
+
+    def __init__(self, kind, raw, email, notify):
+        self.kind = kind          # 'journal' or 'snapshot'
+        self.raw = raw            # Bytes to write
+        self.email = email        # Student the record is about, None for snapshots
+        self.notify = notify      # Error callback for writes nobody waits for
+        self.error = None         # Set by the writer if this write did not reach the disk
+        self.done = threading.Event()
+
+    def wait(self):
+        """Block until the write is finished, raising its error if it failed."""
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
 
 
 class Database:
-    def __init__(self, filename="students.data"):
+    def __init__(self, filename="students.data", journal_limit=64 * 1024):
         self.filename = filename
+        self.journal_filename = os.path.splitext(filename)[0] + ".journal"
+        self.journal_limit = journal_limit  # Journal size in bytes that triggers compaction
+        self._cache = None        # In-memory copy of the student dictionary
+        self._mtime = None        # File modification times the cache was read or written at
+        self._journal_fp = None   # Append handle for the journal, opened on first write
+        self._journal_size = 0    # Bytes journaled since the last snapshot
+        self._id_to_email = {}    # Student ID -> email for the cached data
         self.check_file_exists()
 
+        # Changes wait for their own write by default; the GUI turns this off so the
+        # Tk event loop never blocks on disk I/O and takes failures through on_write_error
+        self.wait_for_writes = True
+        self.on_write_error = None  # Called from the writer thread as on_write_error(email, error)
+
+        # Disk writes run on a background thread, in the order they were queued
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()  # Guards _pending and _mtime, shared with the writer
+        self._pending = 0              # Queued writes not yet on disk
+        threading.Thread(target=self._writer, daemon=True).start()
+
     def check_file_exists(self):
         """Check if students.data file exists; create it if not."""
         if not os.path.exists(self.filename):
-            with open(self.filename, 'wb') as f:
-                pickle.dump({}, f)  # Initialize with an empty dictionary
+            self._write_snapshot(self._dump_snapshot({}))  # Initialize with an empty dictionary
 
     def save_data(self, data):
-        """Write objects to students.data."""
-        with open(self.filename, 'wb') as f:
-            pickle.dump(data, f)
+        """Write objects to students.data and wait until they are on disk."""
+        self._finish([self.save_async(data)], wait=True)
+
+    def save_async(self, data):
+        """Queue a full snapshot of data for writing to students.data."""
+        raw = self._dump_snapshot(data)
+        self._cache = data
+        self._id_to_email = {student.id: email for email, student in data.items()}
+        self._journal_size = 0  # The snapshot contains every journaled change
+        return self._enqueue('snapshot', raw)
 
     def load_data(self):
-        """Read objects from students.data."""
-        with open(self.filename, 'rb') as f:
-            return pickle.load(f)
+        """Read objects from students.data and replay any journaled changes."""
+        with self._lock:
+            if self._cache is not None and self._pending:
+                return self._cache  # Queued writes are newer than the files
+            mtime = self._file_mtimes()
+
+        if self._cache is None or mtime != self._mtime:
+            # Only hit the disk when the files changed outside this instance
+            with open(self.filename, 'rb') as f:
+                data = pickle.load(f)
+            if self._replay_journal(data):
+                mtime = self._file_mtimes()  # The journal was just repaired
+            self._migrate_subjects(data)
+            self._cache = data
+            self._id_to_email = {student.id: email for email, student in data.items()}
+            self._mtime = mtime
+        return self._cache
+
+    def append(self, op, email, student=None):
+        """Record a single change ('put' or 'del') without rewriting the whole file."""
+        data = self.load_data()
+        if op not in ('put', 'del'):
+            raise ValueError(f"Unknown journal operation: {op}")
+
+        # Update in place so edited students keep their position, as they do on replay
+        previous = data.get(email)
+        if previous is not None:
+            self._id_to_email.pop(previous.id, None)
+        if op == 'put':
+            data[email] = student
+            self._id_to_email[student.id] = email
+        elif previous is not None:
+            del data[email]
+
+        # Pickle now so later changes to student don't leak into this record
+        raw = pickle.dumps((op, email, student), protocol=pickle.HIGHEST_PROTOCOL)
+        self._journal_size += len(raw)
+        writes = [self._enqueue('journal', raw, email)]
+
+        if self._journal_size > self.journal_limit:
+            writes.append(self.compact())
+        self._finish(writes)
+
+    def compact(self):
+        """Queue a fresh students.data snapshot that folds in the journal."""
+        return self.save_async(self.load_data())
+
+    def flush(self):
+        """Block until every queued write is finished."""
+        self._queue.join()
+
+    def close(self):
+        """Compact pending changes, wait for the writer and release the journal file."""
+        if self._journal_size:
+            self.save_data(self.load_data())
+        self.flush()
+        if self._journal_fp is not None:
+            self._journal_fp.close()
+            self._journal_fp = None
 
     def clear_data(self):
         """Clear all objects from students.data."""
-        with open(self.filename, 'wb') as f:
-            pickle.dump({}, f)  # Reset to an empty dictionary
+        self.save_data({})  # Reset to an empty dictionary
+
+    def _enqueue(self, kind, raw, email=None):
+        """Hand a pickled journal record or snapshot to the writer thread."""
+        write = _PendingWrite(kind, raw, email, None if self.wait_for_writes else self.on_write_error)
+        with self._lock:
+            self._pending += 1
+        self._queue.put(write)
+        return write
+
+    def _finish(self, writes, wait=None):
+        """Wait for the caller's writes when writes are blocking, raising the first failure."""
+        if not (self.wait_for_writes if wait is None else wait):
+            return
+        try:
+            for write in writes:
+                write.wait()
+        except Exception:
+            self._cache = None  # Re-read what actually reached the disk on the next load
+            raise
+
+    def _writer(self):
+        """Write queued records in the background, coalescing bursts into one write."""
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            # Only the latest snapshot matters, and it already holds every change queued before it
+            snapshots = [i for i, write in enumerate(batch) if write.kind == 'snapshot']
+            records = batch[snapshots[-1] + 1:] if snapshots else batch
+            failed, error = [], None
+            try:
+                if snapshots:
+                    try:
+                        self._write_snapshot(batch[snapshots[-1]].raw)
+                        self._truncate_journal()
+                    except Exception as snapshot_error:
+                        # Records after the snapshot would land in a journal that doesn't match it
+                        failed, error = batch, snapshot_error
+
+                if records and not failed:
+                    try:
+                        if self._journal_fp is None:
+                            self._journal_fp = open(self.journal_filename, 'ab')
+                        self._journal_fp.write(b"".join(write.raw for write in records))
+                        self._journal_fp.flush()
+                    except Exception as journal_error:
+                        failed, error = records, journal_error
+
+                if not failed:
+                    mtime = self._file_mtimes()
+                    with self._lock:
+                        self._mtime = mtime
+            except Exception as unexpected_error:
+                # e.g. students.data removed under us; none of the batch can be relied on
+                failed, error = batch, unexpected_error
+            finally:
+                # Always release the batch, or flush(), close() and blocking callers hang
+                with self._lock:
+                    self._pending -= len(batch)
+                for write in failed:
+                    write.error = error
+                    if write.notify is not None:
+                        try:
+                            write.notify(write.email, error)
+                        except Exception:
+                            pass  # A broken callback must not stop the writer thread
+                for write in batch:
+                    write.done.set()
+                    self._queue.task_done()
+
+    @staticmethod
+    def _dump_snapshot(data):
+        """Pickle data with the newest binary protocol and strip unused opcodes."""
+        return pickletools.optimize(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def _write_snapshot(self, raw):
+        """Write a pickled snapshot to students.data in one call, replacing the old file atomically."""
+        temp_filename = self.filename + ".tmp"
+        with open(temp_filename, 'wb') as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_filename, self.filename)
+
+    def _file_mtimes(self):
+        """Modification times of the snapshot and journal, used to detect outside changes."""
+        journal_mtime = None
+        if os.path.exists(self.journal_filename):
+            journal_mtime = os.stat(self.journal_filename).st_mtime_ns
+        return os.stat(self.filename).st_mtime_ns, journal_mtime
+
+    def _replay_journal(self, data):
+        """Apply journaled changes on top of a loaded snapshot.
+
+        Returns True if a damaged tail had to be cut off the journal.
+        """
+        self._journal_size = 0
+        if not os.path.exists(self.journal_filename):
+            return False
+        size = os.path.getsize(self.journal_filename)
+        with open(self.journal_filename, 'r+b') as f:
+            while True:
+                offset = f.tell()
+                if offset == size:
+                    break
+                try:
+                    op, email, student = pickle.load(f)
+                except Exception:
+                    # A record cut short by an interrupted write. Cut it off so that
+                    # later appends don't end up behind the garbage.
+                    f.truncate(offset)
+                    break
+                if op == 'put':
+                    data[email] = student
+                elif op == 'del':
+                    data.pop(email, None)
+        self._journal_size = offset
+        return offset != size
+
+    @staticmethod
+    def _migrate_subjects(data):
+        """Convert subject lists saved by older versions into dictionaries keyed by ID."""
+        for student in data.values():
+            if isinstance(student.subjects, list):
+                student.subjects = {subject['id']: subject for subject in student.subjects}
+
+    def _truncate_journal(self):
+        """Empty the journal once its changes are part of the snapshot."""
+        if self._journal_fp is not None:
+            self._journal_fp.seek(0)
+            self._journal_fp.truncate()
+        elif os.path.exists(self.journal_filename):
+            os.remove(self.journal_filename)
 
 
 class StudentController:
@@ -108,11 +397,11 @@ class StudentController:
 
     def _is_valid_email(self, email):
         """Validates that the email has the format firstname.lastname@university.com."""
-        return re.match(r"^[a-zA-Z]+\.[a-zA-Z]+@university\.com$", email) is not None
+        return _EMAIL_RE.match(email) is not None
 
     def _is_valid_password(self, password):
         """Validates that the password starts with an uppercase letter, has at least five letters, and ends with three or more digits."""
-        return re.match(r"^[A-Z][a-zA-Z]{4,}\d{3,}$", password) is not None
+        return _PASSWORD_RE.match(password) is not None
 
     def login_student(self, email, password):
         """Logs in a student if email and password match."""
@@ -142,23 +431,26 @@ class StudentController:
         if not self._is_valid_password(new_password):
             print(
                 "\033[91mInvalid password format. Must start with an uppercase letter, contain at least five letters, and end with three or more digits.\033[0m")
-            return
+            return False
 
             # Set the new password and save to the database
         student.password = new_password
-        data = self.database.load_data()
-        data[student.email] = student
-        self.database.save_data(data)
+        try:
+            self.database.append('put', student.email, student)
+        except OSError as error:
+            _report_save_error(error)
+            return False
+        return True
 
     def generate_student_id(self):
         """Generates a unique 6-digit student ID with leading zeros."""
-        data = self.database.load_data()
-        existing_ids = {student.id for student in data.values()}  # Set of IDs already in the database
+        self.database.load_data()  # Refresh the cache if the files changed
+        existing_ids = self.database._id_to_email  # IDs already in the database
 
-        while True:
-            student_id = f"{random.randint(1, 999999):06}"
-            if student_id not in existing_ids:
-                return student_id
+        student_id = _random_student_id()
+        while student_id in existing_ids:
+            student_id = _random_student_id()
+        return student_id
 
     def register_student(self, name, email, password):
         """Registers a new student if email and password are valid and the email is not already in use."""
@@ -174,8 +466,11 @@ class StudentController:
         student_id = self.generate_student_id()
         student = Student(name, email, password)
         student.id = student_id  # Assign the generated student ID
-        data[email] = student
-        self.database.save_data(data)
+        try:
+            self.database.append('put', email, student)
+        except OSError as error:
+            _report_save_error(error)
+            return None
         return student
 
 
@@ -191,27 +486,31 @@ class SubjectController:
             print("\033[91mStudents are allowed to enrol in 4 subjects only.\033[0m")
             return
 
+        # Update the student data in the database
+        try:
+            self.database.append('put', student.email, student)
+        except OSError as error:
+            _report_save_error(error)
+            return
+
         # Print enrollment confirmation
         print(f"\033[93mEnrolling in Subject-{subject_info['id']}\033[0m")
         print(f"\033[93mYou are now enrolled in {len(student.subjects)} out of 4 subjects.\033[0m")
 
-        # Update the student data in the database
-        data = self.database.load_data()
-        data[student.email] = student
-        self.database.save_data(data)
-
     def remove_subject(self, student, subject_id):
         """Removes a subject from the student's enrolled subjects by subject ID."""
-        if not any(subj['id'] == subject_id for subj in student.subjects):
+        if subject_id not in student.subjects:
             print(f"Subject {subject_id} not found.")
             return
 
         student.drop_subject(subject_id)
 
         # Update the student in the database
-        data = self.database.load_data()
-        data[student.email] = student
-        self.database.save_data(data)
+        try:
+            self.database.append('put', student.email, student)
+        except OSError as error:
+            _report_save_error(error)
+            return
         print(f"\033[93mDropping Subject-{subject_id}\033[0m")
         print(f"\033[93mYou are now enrolled in {len(student.subjects)} out of 4 subjects\033[0m")
 
@@ -224,26 +523,21 @@ class SubjectController:
         if not subjects:
             print("\033[93mShowing 0 subjects\033[0m")
         else:
-            for subject in subjects:
+            for subject in subjects.values():
                 print(f"[ Subject::{subject['id']} -- mark = {subject['mark']} -- grade = {subject['grade']} ]")
 
 
 class AdminController:
     def __init__(self, database):
         self.database = database  # Instance of the Database class
-        self.subject = Subject()
-
 
     def show_all_students(self):
         """Displays all registered students and their details."""
         data = self.database.load_data()
         if not data:
-            return "\033[93mStudent List\033[0m\n   < Nothing to Display >"
-        else:
-            output = ["\033[93mStudent List\033[0m"]
-            for email, student in data.items():
-                output.append(f"{student.name} :: {student.id} --> Email: {email}")
-            return "\n".join(output)
+            return _STUDENT_LIST_HEADER + "\n   < Nothing to Display >"
+        body = "\n".join(f"{student.name} :: {student.id} --> Email: {email}" for email, student in data.items())
+        return _STUDENT_LIST_HEADER + "\n" + body
 
     def group_students_by_grade(self):
         """Groups students based on the average grade across their subjects."""
@@ -252,16 +546,12 @@ class AdminController:
 
         for email, student in data.items():
             avg_mark = student.calculate_average_mark()
-            grade = self.subject.assign_grade(avg_mark)
-            groups[grade].append((student.name, student.id, grade, avg_mark))
-
-        for grade, students in groups.items():
-            if students:
-                student_list = ", ".join(
-                    [f"{name} :: {student_id} --> GRADE: {grade} - MARK: {mark:.2f}" for name, student_id, grade, mark
-                     in students]
-                )
-                print(f"   {grade}  --> [{student_list}]")
+            grade = _GRADE_LABELS[bisect.bisect_right(_GRADE_THRESHOLDS, avg_mark)]
+            groups[grade].append(f"{student.name} :: {student.id} --> GRADE: {grade} - MARK: {avg_mark:.2f}")
+
+        for grade, entries in groups.items():
+            if entries:
+                print(f"   {grade}  --> [{', '.join(entries)}]")
             else:
                 print(f"   {grade}  --> [< Nothing to Display >]")
 
@@ -271,32 +561,40 @@ class AdminController:
         passed, failed = [], []
         for email, student in data.items():
             avg_mark = student.calculate_average_mark()
-            if student.is_passing():
+            if student.is_passing():  # Reuses the average cached just above
                 passed.append((student.name, student.id, avg_mark))
             else:
                 failed.append((student.name, student.id, avg_mark))
 
         print("FAIL --> [{}]".format(
-            ", ".join([f"{name} :: {student_id} --> MARK: {mark:.2f}" for name, student_id, mark in failed])))
+            ", ".join(f"{name} :: {student_id} --> MARK: {mark:.2f}" for name, student_id, mark in failed)))
         print("PASS --> [{}]".format(
-            ", ".join([f"{name} :: {student_id} --> MARK: {mark:.2f}" for name, student_id, mark in passed])))
+            ", ".join(f"{name} :: {student_id} --> MARK: {mark:.2f}" for name, student_id, mark in passed)))
 
     def remove_student(self, student_id):
-        """Removes an individual student by ID."""
-        data = self.database.load_data()
-        to_remove = [email for email, student in data.items() if student.id == student_id]
-
-        if to_remove:
-            del data[to_remove[0]]
-            self.database.save_data(data)
+        """Removes an individual student by ID; returns None if the removal could not be saved."""
+        self.database.load_data()  # Refresh the cache if the files changed
+        email = self.database._id_to_email.get(student_id)
+
+        if email is not None:
+            try:
+                self.database.append('del', email)
+            except OSError as error:
+                _report_save_error(error)
+                return None
             return True
         else:
             return False
 
     def clear_all_student_data(self):
         """Clears all student data from the database."""
-        self.database.clear_data()
+        try:
+            self.database.clear_data()
+        except OSError as error:
+            _report_save_error(error)
+            return False
         print("\033[93mAll student data has been cleared.\033[0m")
+        return True
 
 
 class GUIUniApp:
@@ -305,49 +603,85 @@ class GUIUniApp:
         self.subject_controller = subject_controller
         self.logged_in_student = None  # Stores the currently logged-in student
 
+        global tk, messagebox
+        import tkinter as tk
+        from tkinter import messagebox
+
         # Initialize the main window
         self.root = tk.Tk()
         self.root.title("GUIUniApp - Login")
         self.root.geometry("400x300")
 
+        self._frames = {}            # Screens built so far, keyed by name
+        self._current_frame = None   # Screen currently packed into the root window
+
         # Start with the login window
         self.login_window()
 
+    def _show(self, name, build):
+        """Shows the named screen, building it with build(frame) the first time it is needed."""
+        frame = self._frames.get(name)
+        if frame is None:
+            frame = tk.Frame(self.root)
+            build(frame)
+            self._frames[name] = frame
+
+        if frame is not self._current_frame:
+            if self._current_frame is not None:
+                self._current_frame.pack_forget()
+            frame.pack(fill="both", expand=True)
+            self._current_frame = frame
+        return frame
+
+    @staticmethod
+    def _clear_entries(*entries):
+        """Empties the given entry widgets of a reused screen."""
+        for entry in entries:
+            entry.delete(0, tk.END)
+
     def login_window(self):
         """Main login window for students."""
-        self.clear_window()
+        self._show('login', self._build_login)
+        self._clear_entries(self.email_entry, self.password_entry)
 
-        tk.Label(self.root, text="Student Login", font=("Arial", 14)).pack(pady=20)
+    def _build_login(self, frame):
+        """Builds the login screen widgets into frame."""
+        tk.Label(frame, text="Student Login", font=("Arial", 14)).pack(pady=20)
 
-        tk.Label(self.root, text="Email:").pack()
-        self.email_entry = tk.Entry(self.root)
+        tk.Label(frame, text="Email:").pack()
+        self.email_entry = tk.Entry(frame)
         self.email_entry.pack()
 
-        tk.Label(self.root, text="Password:").pack()
-        self.password_entry = tk.Entry(self.root, show="*")
+        tk.Label(frame, text="Password:").pack()
+        self.password_entry = tk.Entry(frame, show="*")
         self.password_entry.pack()
 
-        tk.Button(self.root, text="Login", command=self.submit_login).pack(pady=10)
-        tk.Button(self.root, text="Register", command=self.register_window).pack(pady=5)  # Registration button
+        tk.Button(frame, text="Login", command=self.submit_login).pack(pady=10)
+        tk.Button(frame, text="Register", command=self.register_window).pack(pady=5)  # Registration button
 
     def register_window(self):
         """Registration window for new students."""
-        self.clear_window()
+        self._show('register', self._build_register)
+        self._clear_entries(*self._register_entries)
 
-        tk.Label(self.root, text="Student Registration", font=("Arial", 14)).pack(pady=20)
+    def _build_register(self, frame):
+        """Builds the registration screen widgets into frame."""
+        tk.Label(frame, text="Student Registration", font=("Arial", 14)).pack(pady=20)
 
-        tk.Label(self.root, text="Name:").pack()
-        name_entry = tk.Entry(self.root)
+        tk.Label(frame, text="Name:").pack()
+        name_entry = tk.Entry(frame)
         name_entry.pack()
 
-        tk.Label(self.root, text="Email:").pack()
-        email_entry = tk.Entry(self.root)
+        tk.Label(frame, text="Email:").pack()
+        email_entry = tk.Entry(frame)
         email_entry.pack()
 
-        tk.Label(self.root, text="Password:").pack()
-        password_entry = tk.Entry(self.root, show="*")
+        tk.Label(frame, text="Password:").pack()
+        password_entry = tk.Entry(frame, show="*")
         password_entry.pack()
 
+        self._register_entries = (name_entry, email_entry, password_entry)
+
         def submit_registration():
             name = name_entry.get()
             email = email_entry.get()
@@ -367,8 +701,8 @@ class GUIUniApp:
             else:
                 messagebox.showerror("Error", "Registration failed. Student may already exist.")
 
-        tk.Button(self.root, text="Register", command=submit_registration).pack(pady=10)
-        tk.Button(self.root, text="Back to Login", command=self.login_window).pack(pady=5)
+        tk.Button(frame, text="Register", command=submit_registration).pack(pady=10)
+        tk.Button(frame, text="Back to Login", command=self.login_window).pack(pady=5)
 
     def submit_login(self):
         """Handles login submission and checks student credentials."""
@@ -380,7 +714,7 @@ class GUIUniApp:
             messagebox.showerror("Error", "Please enter both email and password.")
             return
 
-        if not re.match(r"^[a-zA-Z]+\.[a-zA-Z]+@university\.com$", email):
+        if not _EMAIL_RE.match(email):
             messagebox.showerror("Error", "Invalid email format. Use firstname.lastname@university.com.")
             return
 
@@ -396,16 +730,17 @@ class GUIUniApp:
 
     def main_menu_window(self):
         """Main menu window shown after successful login."""
-        self.clear_window()
-
+        self._show('main_menu', self._build_main_menu)
 
-        tk.Label(self.root, text="Main Menu", font=("Arial", 14)).pack(pady=20)
+    def _build_main_menu(self, frame):
+        """Builds the main menu screen widgets into frame."""
+        tk.Label(frame, text="Main Menu", font=("Arial", 14)).pack(pady=20)
 
-        tk.Button(self.root, text="Enroll in a Subject", command=self.enrollment_window, width=20).pack(pady=5)
-        tk.Button(self.root, text="Show Enrolled Subjects", command=self.subject_list_window, width=20).pack(pady=5)
-        tk.Button(self.root, text="Change Password", command=self.change_password_window, width=20).pack(pady=5)
-        tk.Button(self.root, text="Logout", command=self.logout, width=20).pack(pady=5)
-        tk.Button(self.root, text="Exit", command=self.root.quit, width=20).pack(pady=5)
+        tk.Button(frame, text="Enroll in a Subject", command=self.enrollment_window, width=20).pack(pady=5)
+        tk.Button(frame, text="Show Enrolled Subjects", command=self.subject_list_window, width=20).pack(pady=5)
+        tk.Button(frame, text="Change Password", command=self.change_password_window, width=20).pack(pady=5)
+        tk.Button(frame, text="Logout", command=self.logout, width=20).pack(pady=5)
+        tk.Button(frame, text="Exit", command=self.root.quit, width=20).pack(pady=5)
 
     def enrollment_window(self):
         """Window to enroll in a subject, ensuring a max of 4 subjects."""
@@ -413,12 +748,14 @@ class GUIUniApp:
             messagebox.showerror("Error", "Cannot enroll in more than 4 subjects.")
             return
 
-        self.clear_window()
+        self._show('enrollment', self._build_enrollment)
 
-        tk.Label(self.root, text="Enroll in a Subject", font=("Arial", 14)).pack(pady=20)
+    def _build_enrollment(self, frame):
+        """Builds the enrollment screen widgets into frame."""
+        tk.Label(frame, text="Enroll in a Subject", font=("Arial", 14)).pack(pady=20)
 
-        tk.Button(self.root, text="Enroll", command=self.enroll_subject, width=20).pack(pady=10)
-        tk.Button(self.root, text="Back to Main Menu", command=self.main_menu_window, width=20).pack(pady=5)
+        tk.Button(frame, text="Enroll", command=self.enroll_subject, width=20).pack(pady=10)
+        tk.Button(frame, text="Back to Main Menu", command=self.main_menu_window, width=20).pack(pady=5)
 
     def enroll_subject(self):
         """Handles subject enrollment, adds a new subject to the student’s list."""
@@ -429,24 +766,34 @@ class GUIUniApp:
 
     def subject_list_window(self):
         """Displays the list of subjects the student is enrolled in with an option to remove."""
-        self.clear_window()
+        self._show('subject_list', self._build_subject_list)
+        self._clear_entries(self.subject_id_entry)
 
-        tk.Label(self.root, text="Enrolled Subjects", font=("Arial", 14)).pack(pady=20)
+        # Only the subject rows depend on the student, so they are the only widgets rebuilt
+        for widget in self.subject_rows.winfo_children():
+            widget.destroy()
 
         subjects = self.logged_in_student.subjects
         if not subjects:
-            tk.Label(self.root, text="No subjects enrolled.").pack()
+            tk.Label(self.subject_rows, text="No subjects enrolled.").pack()
         else:
-            for subject in subjects:
+            for subject in subjects.values():
                 subject_info = f"ID: {subject['id']}, Mark: {subject['mark']}, Grade: {subject['grade']}"
-                tk.Label(self.root, text=subject_info).pack()
+                tk.Label(self.subject_rows, text=subject_info).pack()
+
+    def _build_subject_list(self, frame):
+        """Builds the subject list screen widgets into frame."""
+        tk.Label(frame, text="Enrolled Subjects", font=("Arial", 14)).pack(pady=20)
 
-        tk.Label(self.root, text="Enter Subject ID to Remove:").pack(pady=10)
-        subject_id_entry = tk.Entry(self.root)
-        subject_id_entry.pack()
+        self.subject_rows = tk.Frame(frame)
+        self.subject_rows.pack()
+
+        tk.Label(frame, text="Enter Subject ID to Remove:").pack(pady=10)
+        self.subject_id_entry = tk.Entry(frame)
+        self.subject_id_entry.pack()
 
         def remove_subject():
-            subject_id = subject_id_entry.get().strip()  # Get and strip any whitespace
+            subject_id = self.subject_id_entry.get().strip()  # Get and strip any whitespace
 
             # Check if the subject ID is provided
             if not subject_id:
@@ -454,7 +801,7 @@ class GUIUniApp:
                 return
 
             # Check if the subject ID exists in the student's enrolled subjects
-            if not any(subj['id'] == subject_id for subj in self.logged_in_student.subjects):
+            if subject_id not in self.logged_in_student.subjects:
                 messagebox.showerror("Error", f"Subject {subject_id} not found.")
                 return
 
@@ -463,23 +810,28 @@ class GUIUniApp:
             messagebox.showinfo("Success", f"Subject {subject_id} removed.")
             self.subject_list_window()
 
-        tk.Button(self.root, text="Remove Subject", command=remove_subject, width=20).pack(pady=5)
-        tk.Button(self.root, text="Back to Main Menu", command=self.main_menu_window, width=20).pack(pady=5)
+        tk.Button(frame, text="Remove Subject", command=remove_subject, width=20).pack(pady=5)
+        tk.Button(frame, text="Back to Main Menu", command=self.main_menu_window, width=20).pack(pady=5)
 
     def change_password_window(self):
         """Window to change the logged-in student's password."""
-        self.clear_window()
+        self._show('change_password', self._build_change_password)
+        self._clear_entries(*self._password_entries)
 
-        tk.Label(self.root, text="Change Password", font=("Arial", 14)).pack(pady=20)
+    def _build_change_password(self, frame):
+        """Builds the change password screen widgets into frame."""
+        tk.Label(frame, text="Change Password", font=("Arial", 14)).pack(pady=20)
 
-        tk.Label(self.root, text="New Password:").pack()
-        new_password_entry = tk.Entry(self.root, show="*")
+        tk.Label(frame, text="New Password:").pack()
+        new_password_entry = tk.Entry(frame, show="*")
         new_password_entry.pack()
 
-        tk.Label(self.root, text="Confirm Password:").pack()
-        confirm_password_entry = tk.Entry(self.root, show="*")
+        tk.Label(frame, text="Confirm Password:").pack()
+        confirm_password_entry = tk.Entry(frame, show="*")
         confirm_password_entry.pack()
 
+        self._password_entries = (new_password_entry, confirm_password_entry)
+
         def submit_change_password():
             new_password = new_password_entry.get()
             confirm_password = confirm_password_entry.get()
@@ -491,26 +843,56 @@ class GUIUniApp:
                 messagebox.showerror("Error", "Invalid password format.")
                 return
 
-            self.student_controller.change_student_password(self.logged_in_student, new_password)
+            if not self.student_controller.change_student_password(self.logged_in_student, new_password):
+                messagebox.showerror("Error", "Password could not be changed.")
+                return
             messagebox.showinfo("Success", "Password changed successfully.")
             self.main_menu_window()
 
-        tk.Button(self.root, text="Change Password", command=submit_change_password, width=20).pack(pady=10)
-        tk.Button(self.root, text="Back to Main Menu", command=self.main_menu_window, width=20).pack(pady=5)
+        tk.Button(frame, text="Change Password", command=submit_change_password, width=20).pack(pady=10)
+        tk.Button(frame, text="Back to Main Menu", command=self.main_menu_window, width=20).pack(pady=5)
 
     def logout(self):
         """Logs out the student and returns to the login window."""
         self.logged_in_student = None
         self.login_window()
 
-    def clear_window(self):
-        """Clears all widgets from the main window."""
-        for widget in self.root.winfo_children():
-            widget.destroy()
-
     def run(self):
-        """Starts the GUI main loop."""
-        self.root.mainloop()
+        """Starts the GUI main loop with saves running in the background, flushing them on exit."""
+        database = self.student_controller.database
+        write_errors = queue.Queue()  # Filled by the writer thread, drained on the Tk thread
+        database.wait_for_writes = False
+        database.on_write_error = lambda email, error: write_errors.put((email, error))
+
+        def check_write_errors():
+            failed = self._drain_write_errors(write_errors)
+            if failed:
+                messagebox.showerror("Error", f"Could not save changes: {failed}")
+            self.root.after(200, check_write_errors)
+
+        self.root.after(200, check_write_errors)
+        try:
+            self.root.mainloop()
+        finally:
+            database.flush()
+            database.wait_for_writes = True
+            database.on_write_error = None
+
+        # The window is gone by now, so report late failures on the console
+        failed = self._drain_write_errors(write_errors)
+        if failed:
+            _report_save_error(failed)
+
+    @staticmethod
+    def _drain_write_errors(write_errors):
+        """Collects queued write failures into one message, or returns None if there are none."""
+        messages = []
+        while True:
+            try:
+                email, error = write_errors.get_nowait()
+            except queue.Empty:
+                return "; ".join(messages) or None
+            messages.append(f"{email or 'all students'}: {error}")
 
 
 class UniversitySystem:
@@ -531,10 +913,18 @@ class UniversitySystem:
                 gui_app.run()  # Launch GUIUniApp without admin options
             elif choice == '3':
                 print(f"\033[93mThank You\033[0m")
+                self.close_database()
                 break
             else:
                 print("Invalid choice.")
 
+    def close_database(self):
+        """Writes pending changes to students.data before the program exits."""
+        try:
+            self.database.close()
+        except OSError as error:
+            _report_save_error(error)
+
     def main_menu(self):
         """Displays the main university menu for CLI with options for Admin, Student, and Exit."""
         while True:
@@ -548,6 +938,7 @@ class UniversitySystem:
                 self.student_menu()
             elif choice == 'x':
                 print("\033[93mThank You\033[0m")
+                self.close_database()
                 exit()
             else:
                 print("\033[93mInvalid option. Please try again.\033[0m")
@@ -631,8 +1022,8 @@ class UniversitySystem:
                         break
 
                 # Change the password after successful confirmation
-                self.student_controller.change_student_password(student, new_password)
-                print("\033[93mPassword updated successfully.\033[0m")
+                if self.student_controller.change_student_password(student, new_password):
+                    print("\033[93mPassword updated successfully.\033[0m")
 
             elif choice == 'e':
                 self.subject_controller.enroll_subject(student)
@@ -657,8 +1048,8 @@ class UniversitySystem:
                 print("\033[93mClearing students database\033[0m")
                 confirm = input("\033[91mAre you sure you want to clear the database (Y)ES/(N)O: \033[0m").lower()
                 if confirm == 'y':
-                    self.admin_controller.clear_all_student_data()
-                    print("\033[93mStudents data cleared\033[0m")
+                    if self.admin_controller.clear_all_student_data():
+                        print("\033[93mStudents data cleared\033[0m")
                 else:
                     print("\033[93mClearing operation cancelled\033[0m")
 
@@ -670,9 +1061,10 @@ class UniversitySystem:
                 self.admin_controller.partition_students_pass_fail()
             elif choice == 'r':
                 student_id = input("Remove by ID: ")
-                if self.admin_controller.remove_student(student_id):
+                removed = self.admin_controller.remove_student(student_id)
+                if removed:
                     print(f"\033[93mRemoving Student {student_id} Account\033[0m")
-                else:
+                elif removed is False:
                     print(f"\033[91mStudent {student_id} does not exist\033[0m")
             elif choice == 's':
                 result = self.admin_controller.show_all_students()
@@ -0,0 +1,263 @@
+import contextlib
+import io
+import os
+import pickle
+import tempfile
+import threading
+import unittest
+
+from python_implementation import Database, Student, Subject, StudentController, SubjectController, AdminController
+
+
+def snapshot(data):
+    """Reduces a student dictionary to plain values that can be compared."""
+    return {email: (student.id, student.name, student.password, dict(student.subjects))
+            for email, student in data.items()}
+
+
+class DatabaseTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.filename = os.path.join(tmp.name, "students.data")
+
+        # Controllers report every action on stdout
+        self.output = io.StringIO()
+        quiet = contextlib.redirect_stdout(self.output)
+        quiet.__enter__()
+        self.addCleanup(quiet.__exit__, None, None, None)
+
+    def open_database(self, **kwargs):
+        database = Database(self.filename, **kwargs)
+        self.addCleanup(database.flush)
+        return database
+
+    def reopen(self, database):
+        """Waits for pending writes and reads the files back into a new Database."""
+        database.flush()
+        return self.open_database().load_data()
+
+
+class DatabaseJournalTest(DatabaseTestCase):
+    def test_changes_survive_reopening(self):
+        database = self.open_database()
+        students = StudentController(database)
+        subjects = SubjectController(database)
+
+        ann = students.register_student("Ann", "ann.lee@university.com", "Annlee123")
+        bob = students.register_student("Bob", "bob.ray@university.com", "Bobray123")
+        students.register_student("Cat", "cat.fox@university.com", "Catfox123")
+        for _ in range(3):
+            subjects.enroll_subject(ann)
+        subjects.remove_subject(ann, next(iter(ann.subjects)))
+        students.change_student_password(ann, "Newpass999")
+        AdminController(database).remove_student(bob.id)
+
+        reloaded = self.reopen(database)
+        self.assertEqual(snapshot(reloaded), snapshot(database.load_data()))
+        self.assertEqual(list(reloaded), ["ann.lee@university.com", "cat.fox@university.com"])
+        self.assertEqual(len(reloaded["ann.lee@university.com"].subjects), 2)
+        self.assertEqual(reloaded["ann.lee@university.com"].password, "Newpass999")
+
+    def test_edits_keep_registration_order(self):
+        database = self.open_database()
+        students = StudentController(database)
+        ann = students.register_student("Ann", "ann.lee@university.com", "Annlee123")
+        students.register_student("Bob", "bob.ray@university.com", "Bobray123")
+        students.register_student("Cat", "cat.fox@university.com", "Catfox123")
+        SubjectController(database).enroll_subject(ann)
+
+        order = ["ann.lee@university.com", "bob.ray@university.com", "cat.fox@university.com"]
+        self.assertEqual(list(database.load_data()), order)
+        self.assertEqual(list(self.reopen(database)), order)
+
+    def test_truncated_final_record_is_ignored(self):
+        database = self.open_database()
+        students = StudentController(database)
+        students.register_student("Ann", "ann.lee@university.com", "Annlee123")
+        students.register_student("Bob", "bob.ray@university.com", "Bobray123")
+        database.flush()
+
+        # Simulate a write interrupted part-way through the last record
+        with open(database.journal_filename, 'r+b') as f:
+            f.truncate(os.path.getsize(database.journal_filename) - 5)
+
+        self.assertEqual(list(self.open_database().load_data()), ["ann.lee@university.com"])
+
+    def test_appends_after_a_truncated_record_survive_reopening(self):
+        database = self.open_database()
+        students = StudentController(database)
+        students.register_student("Ann", "ann.lee@university.com", "Annlee123")
+        database.flush()
+        good_size = os.path.getsize(database.journal_filename)
+        students.register_student("Bob", "bob.ray@university.com", "Bobray123")
+        database.flush()
+        with open(database.journal_filename, 'rb') as f:
+            journal = f.read()
+
+        for cut in range(good_size, len(journal)):
+            with self.subTest(cut=cut):
+                with open(database.journal_filename, 'wb') as f:
+                    f.write(journal[:cut])
+
+                reopened = self.open_database()
+                students = StudentController(reopened)
+                students.register_student("Cat", "cat.fox@university.com", "Catfox123")
+                students.register_student("Dan", "dan.gee@university.com", "Dangee123")
+
+                self.assertEqual(list(self.reopen(reopened)),
+                                 ["ann.lee@university.com", "cat.fox@university.com", "dan.gee@university.com"])
+
+    def test_compaction_folds_journal_into_snapshot(self):
+        database = self.open_database(journal_limit=512)
+        students = StudentController(database)
+        for name in ("Ann", "Bob", "Cat", "Dan", "Eve", "Fay"):
+            students.register_student(name, f"{name.lower()}.x@university.com", "Abcdef123")
+
+        database.flush()
+        self.assertLessEqual(os.path.getsize(database.journal_filename), 512)
+        self.assertEqual(snapshot(self.reopen(database)), snapshot(database.load_data()))
+
+        database.close()
+        self.assertEqual(os.path.getsize(database.journal_filename), 0)
+        with open(self.filename, 'rb') as f:
+            self.assertEqual(snapshot(pickle.load(f)), snapshot(database.load_data()))
+
+    def test_loads_students_saved_by_older_versions(self):
+        # Older versions pickled Student.__dict__ and kept subjects in a list
+        subject = {'id': '042', 'mark': 80, 'grade': 'D'}
+        state = {'id': '000123', 'name': "Ann", 'email': "ann.lee@university.com",
+                 'password': "Annlee123", 'subjects': [subject]}
+
+        class LegacyStudent:
+            def __reduce__(self):
+                return Student.__new__, (Student,), state
+
+        with open(self.filename, 'wb') as f:
+            pickle.dump({"ann.lee@university.com": LegacyStudent()}, f)
+
+        database = self.open_database()
+        ann = database.load_data()["ann.lee@university.com"]
+        self.assertEqual(ann.subjects, {'042': subject})
+        self.assertEqual(ann.calculate_average_mark(), 80)
+
+        database.close()
+        self.assertEqual(snapshot(self.open_database().load_data()), snapshot(database.load_data()))
+
+
+class DatabaseWriterTest(DatabaseTestCase):
+    def break_journal(self, database):
+        database.journal_filename = os.path.join(os.path.dirname(self.filename), "missing", "students.journal")
+
+    def test_failed_write_is_reported_to_its_caller(self):
+        database = self.open_database()
+        self.break_journal(database)
+
+        student = StudentController(database).register_student("Ann", "ann.lee@university.com", "Annlee123")
+        self.assertIsNone(student)
+        self.assertIn("Could not save student data", self.output.getvalue())
+        self.assertNotIn("ann.lee@university.com", database.load_data())
+
+        # The failure belongs to the registration, not to the next operation
+        self.assertTrue(AdminController(database).clear_all_student_data())
+
+    def test_writer_survives_failing_to_stat_the_files(self):
+        database = Database(self.filename)  # No flush on cleanup; it would hang if the writer died
+        students = StudentController(database)
+        students.register_student("Ann", "ann.lee@university.com", "Annlee123")
+
+        # Fail only in the writer thread, as if the files vanished right after the write
+        results = []
+        saving = threading.Thread(target=lambda: results.append(
+            students.register_student("Bob", "bob.ray@university.com", "Bobray123")), daemon=True)
+        callers = {threading.main_thread(), saving}
+        file_mtimes = database._file_mtimes
+
+        def failing_file_mtimes():
+            if threading.current_thread() not in callers:
+                raise FileNotFoundError(database.filename)
+            return file_mtimes()
+
+        database._file_mtimes = failing_file_mtimes
+        saving.start()
+        saving.join(timeout=5)
+        self.assertFalse(saving.is_alive(), "the failed write was never released")
+        self.assertEqual(results, [None])
+        self.assertIn("Could not save student data", self.output.getvalue())
+
+        # The writer thread is still running and takes the next write
+        database._file_mtimes = file_mtimes
+        self.assertIsNotNone(students.register_student("Cat", "cat.fox@university.com", "Catfox123"))
+
+    def test_background_failures_go_to_on_write_error(self):
+        database = self.open_database()
+        database.wait_for_writes = False
+        failures = []
+        database.on_write_error = lambda email, error: failures.append((email, type(error)))
+        self.break_journal(database)
+
+        student = StudentController(database).register_student("Ann", "ann.lee@university.com", "Annlee123")
+        self.assertIsNotNone(student)
+        database.flush()
+        self.assertEqual(failures, [("ann.lee@university.com", FileNotFoundError)])
+
+    def test_burst_is_coalesced_behind_latest_snapshot(self):
+        database = self.open_database()
+        database.wait_for_writes = False
+        students = StudentController(database)
+
+        # Hold the writer inside its first snapshot so the following writes queue up behind it
+        started, release = threading.Event(), threading.Event()
+        snapshots = []
+        write_snapshot = database._write_snapshot
+
+        def held_write_snapshot(raw):
+            started.set()
+            release.wait()
+            snapshots.append(list(pickle.loads(raw)))
+            write_snapshot(raw)
+
+        database._write_snapshot = held_write_snapshot
+        database.save_async({})
+        started.wait()
+
+        students.register_student("Ann", "ann.lee@university.com", "Annlee123")
+        database.compact()
+        students.register_student("Bob", "bob.ray@university.com", "Bobray123")
+        release.set()
+        database.flush()
+
+        # The first snapshot, then only the latest one; Ann's record is folded into it
+        self.assertEqual(snapshots, [[], ["ann.lee@university.com"]])
+        records = []
+        with open(database.journal_filename, 'rb') as f:
+            while True:
+                try:
+                    records.append(pickle.load(f)[1])
+                except EOFError:
+                    break
+        self.assertEqual(records, ["bob.ray@university.com"])
+        self.assertEqual(list(self.reopen(database)), ["ann.lee@university.com", "bob.ray@university.com"])
+
+
+class StudentMarksTest(unittest.TestCase):
+    def student_with_marks(self, *marks):
+        student = Student("Ann", "ann.lee@university.com", "Annlee123")
+        student.subjects = {f"{i:03}": {'id': f"{i:03}", 'mark': mark, 'grade': Subject.assign_grade(mark)}
+                            for i, mark in enumerate(marks, 1)}
+        return student
+
+    def test_is_passing_matches_average(self):
+        for marks in [(), (50,), (49,), (49, 51), (49, 50), (100, 25, 26), (85, 14)]:
+            with self.subTest(marks=marks):
+                expected = bool(marks) and sum(marks) / len(marks) >= 50
+                self.assertEqual(self.student_with_marks(*marks).is_passing(), expected)
+
+                # Same answer once the average has been cached
+                student = self.student_with_marks(*marks)
+                student.calculate_average_mark()
+                self.assertEqual(student.is_passing(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()